@@ -41,6 +41,10 @@ def public(obj: T_Annotatable) -> T_Annotatable:
 
 
 def is_public(obj: Annotatable) -> bool:
+    # Plain functions and classes are their own annotation target, so only unwrap
+    # property/staticmethod/classmethod descriptors when the object itself is not marked.
+    if getattr(obj, _PUBLIC_ATTR_NAME, False):
+        return True
     target = _get_annotation_target(obj)
     return hasattr(target, _PUBLIC_ATTR_NAME) and getattr(target, _PUBLIC_ATTR_NAME)
 
@@ -1,5 +1,6 @@
 import datetime
-from typing import Iterator, Optional, Sequence, Tuple, Union, cast
+import os
+from typing import TYPE_CHECKING, Iterator, Mapping, Optional, Sequence, Tuple, Union, cast
 
 import pendulum
 
@@ -15,6 +16,9 @@
 from ...sensor_definition import DefaultSensorStatus, SensorDefinition, SensorEvaluationContext
 from ..utils import FRESH_UNTIL_METADATA_KEY, ensure_no_duplicate_asset_checks, seconds_in_words
 
+if TYPE_CHECKING:
+    from dagster._core.storage.event_log.base import AssetCheckSummaryRecord
+
 DEFAULT_FRESHNESS_SENSOR_NAME = "freshness_checks_sensor"
 MAXIMUM_RUNTIME_SECONDS = 35  # Due to GRPC communications, only allow this sensor to run for 40 seconds before pausing iteration and resuming in the next run. Leave a bit of time for run requests to be processed.
 FRESHNESS_SENSOR_DESCRIPTION = """
@@ -26,6 +30,10 @@
     """
 
 
+def _get_max_bind_params() -> int:
+    return int(os.getenv("ASSET_CHECK_SENSOR_MAX_BIND_PARAMS", "500"))
+
+
 @experimental
 def build_sensor_for_freshness_checks(
     *,
@@ -72,6 +80,19 @@ def build_sensor_for_freshness_checks(
         "Interval must be a positive integer.",
     )
     check.str_param(name, "name")
+    # The set of checks is fixed once the sensor is built, so sort the check keys up front rather
+    # than on every tick. The cursor stores the index of the check key the sensor left off at.
+    asset_check_keys_sorted = tuple(
+        sorted(
+            [
+                asset_check_spec.key
+                for asset_check in freshness_checks
+                for asset_check_spec in asset_check.check_specs
+            ],
+            key=lambda key: key.to_user_string(),
+        )
+    )
+    asset_check_key_indices = {key: idx for idx, key in enumerate(asset_check_keys_sorted)}
 
     @sensor(
         name=name,
@@ -81,16 +102,14 @@ def build_sensor_for_freshness_checks(
         description=FRESHNESS_SENSOR_DESCRIPTION,
     )
     def the_sensor(context: SensorEvaluationContext) -> Optional[Union[RunRequest, SkipReason]]:
-        left_off_asset_check_key = (
-            AssetCheckKey.from_user_string(context.cursor) if context.cursor else None
-        )
+        left_off_idx = get_left_off_index_from_cursor(context.cursor, asset_check_key_indices)
         start_time = pendulum.now("UTC")
         checks_to_evaluate = []
         checks_iter = freshness_checks_get_evaluations_iter(
             context=context,
             start_time=start_time,
-            left_off_asset_check_key=left_off_asset_check_key,
-            freshness_checks=freshness_checks,
+            left_off_idx=left_off_idx,
+            asset_check_keys_sorted=asset_check_keys_sorted,
         )
         # We evaluate checks using an iterator which yields back control to the main loop every
         # iteration; this allows us to pause the sensor if it runs into the maximum runtime.
@@ -102,7 +121,7 @@ def the_sensor(context: SensorEvaluationContext) -> Optional[Union[RunRequest, S
             if should_evaluate:
                 checks_to_evaluate.append(check_key)
             check_key, should_evaluate = next(checks_iter, (None, False))
-        new_cursor = check_key.to_user_string() if check_key else None
+        new_cursor = str(asset_check_key_indices[check_key]) if check_key else None
         context.update_cursor(new_cursor)
         if checks_to_evaluate:
             return RunRequest(asset_check_keys=checks_to_evaluate)
@@ -114,21 +133,33 @@ def the_sensor(context: SensorEvaluationContext) -> Optional[Union[RunRequest, S
     return the_sensor
 
 
-def ordered_iterator_freshness_checks_starting_with_key(
-    left_off_asset_check_key: Optional[AssetCheckKey],
-    freshness_checks: Sequence[AssetChecksDefinition],
+def get_left_off_index_from_cursor(
+    cursor: Optional[str], asset_check_key_indices: Mapping[AssetCheckKey, int]
+) -> Optional[int]:
+    """Returns the index of the asset check key that the sensor left off at, if any.
+
+    The index is only validated against the current number of checks. If checks are added or
+    removed before the left off position between evaluations, the index resolves to a different
+    check key, and the sensor resumes from a shifted position for one pass. This is the accepted
+    cost of storing an index rather than a key in the cursor; it is not safe to rely on index
+    cursors identifying the same check across redeploys.
+    """
+    if not cursor:
+        return None
+    if cursor.isdigit():
+        left_off_idx = int(cursor)
+        # If the set of checks shrank since the cursor was written, start over from the beginning.
+        return left_off_idx if left_off_idx < len(asset_check_key_indices) else None
+    # Cursors written by earlier versions of this sensor store the check key's user string.
+    return asset_check_key_indices.get(AssetCheckKey.from_user_string(cursor))
+
+
+def ordered_iterator_freshness_checks_starting_after_index(
+    left_off_idx: Optional[int],
+    asset_check_keys_sorted: Sequence[AssetCheckKey],
 ) -> Iterator[AssetCheckKey]:
-    asset_check_keys_sorted = sorted(
-        [
-            asset_check_spec.key
-            for asset_check in freshness_checks
-            for asset_check_spec in asset_check.check_specs
-        ],
-        key=lambda key: key.to_user_string(),
-    )
-    # Offset based on the left off asset check key, but then iterate back through the beginning afterwards
-    if left_off_asset_check_key:
-        left_off_idx = asset_check_keys_sorted.index(left_off_asset_check_key)
+    # Start after the check at the left off index, then wrap around to the beginning afterwards
+    if left_off_idx is not None:
         yield from asset_check_keys_sorted[left_off_idx + 1 :]
         yield from asset_check_keys_sorted[: left_off_idx + 1]
     else:
@@ -138,16 +169,27 @@ def ordered_iterator_freshness_checks_starting_with_key(
 def freshness_checks_get_evaluations_iter(
     context: SensorEvaluationContext,
     start_time: datetime.datetime,
-    left_off_asset_check_key: Optional[AssetCheckKey],
-    freshness_checks: Sequence[AssetChecksDefinition],
+    left_off_idx: Optional[int],
+    asset_check_keys_sorted: Sequence[AssetCheckKey],
 ) -> Iterator[Tuple[AssetCheckKey, bool]]:
     """Yields the set of freshness check keys to evaluate."""
-    for check_key in ordered_iterator_freshness_checks_starting_with_key(
-        left_off_asset_check_key, freshness_checks
-    ):
-        summary_record = context.instance.event_log_storage.get_asset_check_summary_records(
-            [check_key]
-        )[check_key]
+    ordered_check_keys = list(
+        ordered_iterator_freshness_checks_starting_after_index(
+            left_off_idx, asset_check_keys_sorted
+        )
+    )
+    # Each check key binds two parameters (asset key and check name) in the batched summary record
+    # query, so we fetch records in chunks to keep each query within the bind parameter budget.
+    # Chunks are fetched lazily, so if the sensor pauses due to the maximum runtime, we don't query
+    # for checks that won't be evaluated this tick.
+    chunk_size = max(_get_max_bind_params() // 2, 1)
+    summary_records: Mapping[AssetCheckKey, "AssetCheckSummaryRecord"] = {}
+    for idx, check_key in enumerate(ordered_check_keys):
+        if idx % chunk_size == 0:
+            summary_records = context.instance.event_log_storage.get_asset_check_summary_records(
+                ordered_check_keys[idx : idx + chunk_size]
+            )
+        summary_record = summary_records[check_key]
         # Case 1: We have never run the check before. We should run it.
         if summary_record.last_check_execution_record is None:
             context.log.info(
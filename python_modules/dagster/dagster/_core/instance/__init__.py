@@ -2405,6 +2405,9 @@ def handle_new_event(
             else:
                 return
 
+        self._store_and_notify_events(events)
+
+    def _store_and_notify_events(self, events: Sequence["EventLogEntry"]) -> None:
         if len(events) == 1:
             self._event_storage.store_event(events[0])
         else:
@@ -2423,6 +2426,9 @@ def handle_new_event(
                 for event in events:
                     self._event_storage.store_event(event)
 
+        self._notify_events(events)
+
+    def _notify_events(self, events: Sequence["EventLogEntry"]) -> None:
         for event in events:
             run_id = event.run_id
             if event.is_dagster_event and event.get_dagster_event().is_job_event:
@@ -3188,6 +3194,56 @@ def report_runless_asset_event(
         asset_event: Union["AssetMaterialization", "AssetObservation", "AssetCheckEvaluation"],
     ):
         """Record an event log entry related to assets that does not belong to a Dagster run."""
+        return self.report_dagster_event(
+            run_id=RUNLESS_RUN_ID,
+            dagster_event=self._get_runless_asset_dagster_event(asset_event),
+        )
+
+    @experimental
+    def report_runless_asset_events(
+        self,
+        asset_events: Sequence[
+            Union["AssetMaterialization", "AssetObservation", "AssetCheckEvaluation"]
+        ],
+    ) -> None:
+        """Record a batch of event log entries related to assets that do not belong to a Dagster
+        run. Batches consisting only of asset check evaluations are handed to the event log storage
+        in a single batch write; any other batch is stored one event at a time.
+        """
+        from dagster._core.events.log import EventLogEntry
+
+        check.sequence_param(asset_events, "asset_events")
+        if not asset_events:
+            return
+
+        timestamp = time.time()
+        events = [
+            EventLogEntry(
+                user_message="",
+                level=logging.INFO,
+                job_name=RUNLESS_JOB_NAME,
+                run_id=RUNLESS_RUN_ID,
+                error_info=None,
+                timestamp=timestamp,
+                dagster_event=self._get_runless_asset_dagster_event(asset_event),
+            )
+            for asset_event in asset_events
+        ]
+        if all(isinstance(asset_event, AssetCheckEvaluation) for asset_event in asset_events):
+            # The batch write commits the event log rows before the asset check execution rows, so
+            # there is no fallback to individual writes here, which could store events twice.
+            self._event_storage.store_event_batch(events)
+            self._notify_events(events)
+        else:
+            # batch writes of materializations and observations only update the asset record of
+            # the last event in the batch, so each event is written individually
+            for event in events:
+                self._store_and_notify_events([event])
+
+    def _get_runless_asset_dagster_event(
+        self,
+        asset_event: Union["AssetMaterialization", "AssetObservation", "AssetCheckEvaluation"],
+    ) -> "DagsterEvent":
         from dagster._core.events import (
             AssetMaterialization,
             AssetObservationData,
@@ -3211,13 +3267,10 @@ def report_runless_asset_event(
                 " AssetMaterialization, AssetObservation or AssetCheckEvaluation"
             )
 
-        return self.report_dagster_event(
-            run_id=RUNLESS_RUN_ID,
-            dagster_event=DagsterEvent(
-                event_type_value=event_type_value,
-                event_specific_data=data_payload,
-                job_name=RUNLESS_JOB_NAME,
-            ),
+        return DagsterEvent(
+            event_type_value=event_type_value,
+            event_specific_data=data_payload,
+            job_name=RUNLESS_JOB_NAME,
         )
 
     def get_asset_check_support(self) -> "AssetCheckInstanceSupport":
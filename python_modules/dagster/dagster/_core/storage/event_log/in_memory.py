@@ -91,6 +91,11 @@ def store_event(self, event):
             except Exception:
                 logging.exception("Exception in callback for event watch on run %s.", event.run_id)
 
+    def store_event_batch(self, events):
+        # store events individually, so that watchers are notified with a cursor for each event
+        for event in events:
+            self.store_event(event)
+
     def watch(self, run_id: str, cursor: str, callback: Callable[..., Any]):
         self._handlers[run_id].add(callback)
 
@@ -183,15 +183,25 @@ def upgrade(self) -> None:
     def has_table(self, table_name: str) -> bool:
         """This method checks if a table exists in the database."""
 
-    def prepare_insert_event(self, event: EventLogEntry) -> Any:
+    def prepare_insert_event(
+        self, event: EventLogEntry, serialized_event: Optional[str] = None
+    ) -> Any:
         """Helper method for preparing the event log SQL insertion statement.  Abstracted away to
         have a single place for the logical table representation of the event, while having a way
         for SQL backends to implement different execution implementations for `store_event`. See
         the `dagster-postgres` implementation which overrides the generic SQL implementation of
         `store_event`.
+
+        Args:
+            event (EventLogEntry): The event to insert.
+            serialized_event (Optional[str]): The already serialized event, if the caller has one,
+                so that it is not serialized again. Subclasses overriding this method must accept
+                it, since batched runless asset check evaluation writes pass it positionally.
         """
         # https://stackoverflow.com/a/54386260/324449
-        return SqlEventLogStorageTable.insert().values(**self._event_to_row(event))
+        return SqlEventLogStorageTable.insert().values(
+            **self._event_to_row(event, serialized_event)
+        )
 
     def prepare_insert_event_batch(self, events: Sequence[EventLogEntry]) -> Any:
         # https://stackoverflow.com/a/54386260/324449
@@ -199,7 +209,9 @@ def prepare_insert_event_batch(self, events: Sequence[EventLogEntry]) -> Any:
             [self._event_to_row(event) for event in events]
         )
 
-    def _event_to_row(self, event: EventLogEntry) -> Dict[str, Any]:
+    def _event_to_row(
+        self, event: EventLogEntry, serialized_event: Optional[str] = None
+    ) -> Dict[str, Any]:
         dagster_event_type = None
         asset_key_str = None
         partition = None
@@ -216,7 +228,7 @@ def _event_to_row(self, event: EventLogEntry) -> Dict[str, Any]:
 
         return {
             "run_id": event.run_id,
-            "event": serialize_value(event),
+            "event": serialized_event if serialized_event is not None else serialize_value(event),
             "dagster_event_type": dagster_event_type,
             "timestamp": self._event_insert_timestamp(event),
             "step_key": step_key,
@@ -471,6 +483,40 @@ def store_event(self, event: EventLogEntry) -> None:
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
+    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        # Runless asset check evaluations are written together: their event log rows are inserted
+        # over a single connection, and their asset check execution rows in a single executemany
+        # statement. Any other batch of events is stored one event at a time.
+        if not events or not all(
+            _is_runless_asset_check_evaluation_event(event) for event in events
+        ):
+            super().store_event_batch(events)
+            return
+
+        check.invariant(
+            self.supports_asset_checks,
+            "Asset checks require a database schema migration. Run `dagster instance migrate`.",
+        )
+
+        # each event is stored in both the event log and asset check executions tables, so only
+        # serialize it once
+        serialized_events = [serialize_value(event) for event in events]
+        event_ids = self._store_runless_event_rows(events, serialized_events)
+        self._bulk_store_asset_check_evaluations(events, event_ids, serialized_events)
+
+    def _store_runless_event_rows(
+        self, events: Sequence[EventLogEntry], serialized_events: Sequence[str]
+    ) -> Sequence[Optional[int]]:
+        with self.run_connection(events[0].run_id) as conn:
+            return [
+                conn.execute(
+                    self.prepare_insert_event(event, serialized_event)
+                ).inserted_primary_key[0]
+                for event, serialized_event in zip(events, serialized_events)
+            ]
+
     def get_records_for_run(
         self,
         run_id,
@@ -1322,13 +1368,16 @@ def get_asset_records(
     def get_asset_check_summary_records(
         self, asset_check_keys: Sequence[AssetCheckKey]
     ) -> Mapping[AssetCheckKey, AssetCheckSummaryRecord]:
+        # fetch the latest execution for every requested check in a single query, rather than
+        # issuing one history query per check key
+        latest_execution_records = self.get_latest_asset_check_execution_by_key(asset_check_keys)
         states = {}
         for asset_check_key in asset_check_keys:
-            execution_record = self.get_asset_check_execution_history(asset_check_key, limit=1)
+            execution_record = latest_execution_records.get(asset_check_key)
             states[asset_check_key] = AssetCheckSummaryRecord(
                 asset_check_key=asset_check_key,
-                last_check_execution_record=execution_record[0] if execution_record else None,
-                last_run_id=execution_record[0].run_id if execution_record else None,
+                last_check_execution_record=execution_record,
+                last_run_id=execution_record.run_id if execution_record else None,
             )
         return states
 
@@ -2806,31 +2855,54 @@ def _event_insert_timestamp(self, event):
     def _store_runless_asset_check_evaluation(
         self, event: EventLogEntry, event_id: Optional[int]
     ) -> None:
-        evaluation = cast(
-            AssetCheckEvaluation, check.not_none(event.dagster_event).event_specific_data
-        )
         with self.index_connection() as conn:
             conn.execute(
                 AssetCheckExecutionsTable.insert().values(
-                    asset_key=evaluation.asset_key.to_string(),
-                    check_name=evaluation.check_name,
-                    run_id=event.run_id,
-                    execution_status=(
-                        AssetCheckExecutionRecordStatus.SUCCEEDED.value
-                        if evaluation.passed
-                        else AssetCheckExecutionRecordStatus.FAILED.value
-                    ),
-                    evaluation_event=serialize_value(event),
-                    evaluation_event_timestamp=self._event_insert_timestamp(event),
-                    evaluation_event_storage_id=event_id,
-                    materialization_event_storage_id=(
-                        evaluation.target_materialization_data.storage_id
-                        if evaluation.target_materialization_data
-                        else None
-                    ),
+                    **self._runless_asset_check_evaluation_row(
+                        event, event_id, serialize_value(event)
+                    )
                 )
             )
 
+    def _bulk_store_asset_check_evaluations(
+        self,
+        events: Sequence[EventLogEntry],
+        event_ids: Sequence[Optional[int]],
+        serialized_events: Sequence[str],
+    ) -> None:
+        # passing a list of rows to a single insert statement uses the DBAPI executemany path
+        rows = [
+            self._runless_asset_check_evaluation_row(event, event_id, serialized_event)
+            for event, event_id, serialized_event in zip(events, event_ids, serialized_events)
+        ]
+        with self.index_connection() as conn:
+            conn.execute(AssetCheckExecutionsTable.insert(), rows)
+
+    def _runless_asset_check_evaluation_row(
+        self, event: EventLogEntry, event_id: Optional[int], serialized_event: str
+    ) -> Dict[str, Any]:
+        evaluation = cast(
+            AssetCheckEvaluation, check.not_none(event.dagster_event).event_specific_data
+        )
+        return dict(
+            asset_key=evaluation.asset_key.to_string(),
+            check_name=evaluation.check_name,
+            run_id=event.run_id,
+            execution_status=(
+                AssetCheckExecutionRecordStatus.SUCCEEDED.value
+                if evaluation.passed
+                else AssetCheckExecutionRecordStatus.FAILED.value
+            ),
+            evaluation_event=serialized_event,
+            evaluation_event_timestamp=self._event_insert_timestamp(event),
+            evaluation_event_storage_id=event_id,
+            materialization_event_storage_id=(
+                evaluation.target_materialization_data.storage_id
+                if evaluation.target_materialization_data
+                else None
+            ),
+        )
+
     def _update_asset_check_evaluation(self, event: EventLogEntry, event_id: Optional[int]) -> None:
         evaluation = cast(
             AssetCheckEvaluation, check.not_none(event.dagster_event).event_specific_data
@@ -2991,6 +3063,14 @@ def get_latest_planned_materialization_info(
         )
 
 
+def _is_runless_asset_check_evaluation_event(event: EventLogEntry) -> bool:
+    return (
+        event.is_dagster_event
+        and event.dagster_event_type == DagsterEventType.ASSET_CHECK_EVALUATION
+        and not event.run_id
+    )
+
+
 def _get_from_row(row: SqlAlchemyRow, column: str) -> object:
     """Utility function for extracting a column from a sqlalchemy row proxy, since '_asdict' is not
     supported in sqlalchemy 1.3.
@@ -270,6 +270,22 @@ def store_event(self, event: EventLogEntry) -> None:
             with self.index_connection() as conn:
                 conn.execute(insert_event_statement)
 
+    def _store_runless_event_rows(
+        self, events: Sequence[EventLogEntry], serialized_events: Sequence[str]
+    ) -> Sequence[Optional[int]]:
+        # runless asset check evaluations are not mirrored in the index shard, so there is no
+        # cross-run storage id to reference from the asset check executions table, and the rows
+        # can be inserted with a single executemany statement
+        with self.run_connection(events[0].run_id) as conn:
+            conn.execute(
+                SqlEventLogStorageTable.insert(),
+                [
+                    self._event_to_row(event, serialized_event)
+                    for event, serialized_event in zip(events, serialized_events)
+                ],
+            )
+        return [None] * len(events)
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
@@ -31,8 +31,9 @@
     DagsterInvalidConfigError,
     DagsterInvariantViolationError,
 )
+from dagster._core.events import DagsterEventType
 from dagster._core.execution.api import create_execution_plan
-from dagster._core.instance import DagsterInstance, InstanceRef
+from dagster._core.instance import RUNLESS_RUN_ID, DagsterInstance, InstanceRef
 from dagster._core.instance.config import DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
 from dagster._core.launcher import LaunchRunContext, RunLauncher
 from dagster._core.run_coordinator.queued_run_coordinator import QueuedRunCoordinator
@@ -771,6 +772,78 @@ def test_report_runless_asset_event():
         assert len(records) == 1
 
 
+def test_report_runless_asset_events():
+    with instance_for_test() as instance:
+        asset_keys = [AssetKey("a"), AssetKey("b")]
+        storage = instance.event_log_storage
+
+        with patch.object(
+            storage, "store_event_batch", wraps=storage.store_event_batch
+        ) as store_event_batch_mock:
+            instance.report_runless_asset_events(
+                [AssetMaterialization(asset_key) for asset_key in asset_keys]
+            )
+        # materializations are written individually, so that every asset record is updated
+        assert store_event_batch_mock.call_count == 0
+        mats = instance.get_latest_materialization_events(asset_keys)
+        assert all(mats[asset_key] for asset_key in asset_keys)
+        assert all(
+            record.asset_entry.last_materialization
+            for record in instance.get_asset_records(asset_keys)
+        )
+
+        check_keys = [AssetCheckKey(asset_key, "my_check") for asset_key in asset_keys]
+        with patch.object(
+            storage, "store_event_batch", wraps=storage.store_event_batch
+        ) as store_event_batch_mock:
+            instance.report_runless_asset_events(
+                [
+                    AssetCheckEvaluation(
+                        asset_key=check_key.asset_key,
+                        check_name=check_key.name,
+                        passed=True,
+                        metadata={},
+                    )
+                    for check_key in check_keys
+                ]
+            )
+        assert store_event_batch_mock.call_count == 1
+        assert len(storage.get_latest_asset_check_execution_by_key(check_keys)) == 2
+
+
+def test_report_runless_asset_events_batch_failure():
+    with instance_for_test() as instance:
+        check_keys = [AssetCheckKey(AssetKey(name), "my_check") for name in ["a", "b"]]
+        storage = instance.event_log_storage
+
+        with patch.object(
+            storage,
+            "_bulk_store_asset_check_evaluations",
+            side_effect=Exception("failed to store check executions"),
+        ):
+            with pytest.raises(Exception, match="failed to store check executions"):
+                instance.report_runless_asset_events(
+                    [
+                        AssetCheckEvaluation(
+                            asset_key=check_key.asset_key,
+                            check_name=check_key.name,
+                            passed=True,
+                            metadata={},
+                        )
+                        for check_key in check_keys
+                    ]
+                )
+
+        # The failed batch is not retried one event at a time, which would store each event twice.
+        # The event log rows written before the failure are left without matching asset check
+        # execution rows; that is a known limitation of the batch write, not behavior to rely on.
+        logs = instance.all_logs(RUNLESS_RUN_ID, of_type=DagsterEventType.ASSET_CHECK_EVALUATION)
+        stored_check_keys = [
+            log.asset_check_evaluation.asset_check_key for log in logs if log.asset_check_evaluation
+        ]
+        assert len(stored_check_keys) == len(set(stored_check_keys))
+
+
 def test_invalid_run_id():
     with instance_for_test() as instance:
         with pytest.raises(
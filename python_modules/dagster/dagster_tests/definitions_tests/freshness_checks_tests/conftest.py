@@ -16,6 +16,7 @@
 from dagster._core.execution.execute_in_process_result import ExecuteInProcessResult
 from dagster._core.instance import DagsterInstance
 from dagster._core.instance_for_test import instance_for_test
+from dagster._seven.compat.pendulum import pendulum_freeze_time
 from mock import patch
 
 
@@ -25,6 +26,18 @@ def instance_fixture() -> Iterator[DagsterInstance]:
         yield instance
 
 
+@pytest.fixture(name="freeze_time", scope="module")
+def freeze_time_fixture() -> pendulum.DateTime:
+    return pendulum.datetime(2024, 1, 1, tz="UTC")
+
+
+@pytest.fixture(name="frozen")
+def frozen_fixture(freeze_time: pendulum.DateTime) -> Iterator[pendulum.DateTime]:
+    """Freezes pendulum's clock at the module-wide `freeze_time` for the duration of the test."""
+    with pendulum_freeze_time(freeze_time):
+        yield freeze_time
+
+
 @pytest.fixture(name="pendulum_aware_report_dagster_event")
 def pendulum_aware_report_dagster_event_fixture() -> Iterator[None]:
     def pendulum_aware_report_dagster_event(
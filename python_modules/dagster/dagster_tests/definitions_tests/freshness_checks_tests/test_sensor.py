@@ -2,7 +2,7 @@
 
 import datetime
 import logging  # noqa: F401; used by mock in string form
-import time
+from functools import lru_cache
 
 import pendulum
 import pytest
@@ -27,8 +27,29 @@
 from dagster._core.definitions.sensor_definition import build_sensor_context
 from dagster._core.events import DagsterEvent, DagsterEventType
 from dagster._core.events.log import EventLogEntry
-from dagster._core.utils import make_new_run_id
-from dagster._seven.compat.pendulum import pendulum_freeze_time
+from mock import patch
+
+
+@lru_cache(maxsize=None)
+def _ak(name: str) -> AssetKey:
+    return AssetKey(name)
+
+
+@lru_cache(maxsize=None)
+def _ack(name: str) -> AssetCheckKey:
+    return AssetCheckKey(_ak(name), "freshness_check")
+
+
+_FIXED_RUN_ID = "3b8c0d5e-9a41-4f6e-8b2d-7c1e5a9f0d24"
+
+# Offsets from the frozen clock at which a check's freshness window has already lapsed, or has
+# not yet lapsed.
+_OUT_OF_DATE_TS_OFFSET = -300.0
+_FRESH_TS_OFFSET = 300.0
+
+
+def _fresh_meta(base_ts: float, offset_sec: float) -> dict:
+    return {FRESH_UNTIL_METADATA_KEY: FloatMetadataValue(base_ts + offset_sec)}
 
 
 def test_params() -> None:
@@ -61,7 +82,7 @@ def my_asset():
 
 
 def test_sensor_multi_asset_different_states(
-    instance: DagsterInstance, pendulum_aware_report_dagster_event: None
+    instance: DagsterInstance, frozen: pendulum.DateTime
 ) -> None:
     """Test the case where we have multiple assets in the same multi asset in different states. Ensure that the sensor
     handles each state correctly.
@@ -82,58 +103,45 @@ def my_asset():
         assets=[my_asset], lower_bound_delta=datetime.timedelta(minutes=10)
     )
 
-    freeze_time = pendulum.now("UTC")
-    with pendulum_freeze_time(freeze_time):
-        instance.report_runless_asset_event(
+    base_ts = frozen.timestamp()
+    # (asset key, passed, fresh until offset from the frozen clock)
+    evaluation_rows = [
+        ("failed_eval", False, None),
+        ("success_eval_expired", True, _OUT_OF_DATE_TS_OFFSET),
+        ("success_eval_unexpired", True, _FRESH_TS_OFFSET),
+    ]
+    # Batch-reported events bypass report_dagster_event, so they are stored with the wall clock
+    # timestamp rather than the frozen time. The sensor only compares fresh until metadata against
+    # the frozen clock, so the stored timestamp does not affect the result.
+    instance.report_runless_asset_events(
+        [
             AssetCheckEvaluation(
-                asset_key=AssetKey("failed_eval"),
+                asset_key=_ak(asset_key),
                 check_name="freshness_check",
-                passed=False,
-                metadata={},
-            )
-        )
-        instance.report_runless_asset_event(
-            AssetCheckEvaluation(
-                asset_key=AssetKey("success_eval_expired"),
-                check_name="freshness_check",
-                passed=True,
-                metadata={
-                    FRESH_UNTIL_METADATA_KEY: FloatMetadataValue(
-                        freeze_time.subtract(minutes=5).timestamp()
-                    )
-                },
-            )
-        )
-        instance.report_runless_asset_event(
-            AssetCheckEvaluation(
-                asset_key=AssetKey("success_eval_unexpired"),
-                check_name="freshness_check",
-                passed=True,
-                metadata={
-                    FRESH_UNTIL_METADATA_KEY: FloatMetadataValue(
-                        freeze_time.add(minutes=5).timestamp()
-                    )
-                },
+                passed=passed,
+                metadata=_fresh_meta(base_ts, offset) if offset is not None else {},
             )
-        )
+            for asset_key, passed, offset in evaluation_rows
+        ]
+    )
 
-        sensor = build_sensor_for_freshness_checks(freshness_checks=freshness_checks)
-        defs = Definitions(asset_checks=freshness_checks, assets=[my_asset], sensors=[sensor])
+    sensor = build_sensor_for_freshness_checks(freshness_checks=freshness_checks)
+    defs = Definitions(asset_checks=freshness_checks, assets=[my_asset], sensors=[sensor])
 
-        context = build_sensor_context(instance=instance, definitions=defs)
+    context = build_sensor_context(instance=instance, definitions=defs)
 
-        # Upon evaluation, we should get a run request for never_eval and success_eval_expired.
-        run_request = sensor(context)
-        assert isinstance(run_request, RunRequest)
-        assert run_request.asset_check_keys == [
-            AssetCheckKey(AssetKey("never_eval"), "freshness_check"),
-            AssetCheckKey(AssetKey("success_eval_expired"), "freshness_check"),
-        ]
-        # Cursor should be None, since we made it through all assets.
-        assert context.cursor is None
+    # Upon evaluation, we should get a run request for never_eval and success_eval_expired.
+    run_request = sensor(context)
+    assert isinstance(run_request, RunRequest)
+    assert run_request.asset_check_keys == [
+        _ack("never_eval"),
+        _ack("success_eval_expired"),
+    ]
+    # Cursor should be None, since we made it through all assets.
+    assert context.cursor is None
 
 
-def test_sensor_evaluation_planned(instance: DagsterInstance) -> None:
+def test_sensor_evaluation_planned(instance: DagsterInstance, frozen: pendulum.DateTime) -> None:
     """Test the case where the asset check is currently planned to evaluate. We shouldn't attempt to re-evalaute the check in this case."""
 
     @asset
@@ -144,36 +152,61 @@ def my_asset():
         assets=[my_asset], lower_bound_delta=datetime.timedelta(minutes=10)
     )
 
-    freeze_time = pendulum.now("UTC")
-    with pendulum_freeze_time(freeze_time):
-        instance.event_log_storage.store_event(
-            EventLogEntry(
-                error_info=None,
-                user_message="",
-                level="debug",
-                run_id=make_new_run_id(),
-                timestamp=time.time(),
-                dagster_event=DagsterEvent(
-                    DagsterEventType.ASSET_CHECK_EVALUATION_PLANNED.value,
-                    "nonce",
-                    event_specific_data=AssetCheckEvaluationPlanned(
-                        asset_key=my_asset.key, check_name="freshness_check"
-                    ),
+    instance.event_log_storage.store_event(
+        EventLogEntry(
+            error_info=None,
+            user_message="",
+            level="debug",
+            run_id=_FIXED_RUN_ID,
+            timestamp=frozen.timestamp(),
+            dagster_event=DagsterEvent(
+                DagsterEventType.ASSET_CHECK_EVALUATION_PLANNED.value,
+                "nonce",
+                event_specific_data=AssetCheckEvaluationPlanned(
+                    asset_key=my_asset.key, check_name="freshness_check"
                 ),
-            )
+            ),
         )
-        sensor = build_sensor_for_freshness_checks(freshness_checks=freshness_checks)
-        defs = Definitions(asset_checks=freshness_checks, assets=[my_asset], sensors=[sensor])
-        context = build_sensor_context(instance=instance, definitions=defs)
-
+    )
+    sensor = build_sensor_for_freshness_checks(freshness_checks=freshness_checks)
+    defs = Definitions(asset_checks=freshness_checks, assets=[my_asset], sensors=[sensor])
+    context = build_sensor_context(instance=instance, definitions=defs)
+
+    storage = instance.event_log_storage
+    with patch.object(
+        storage,
+        "get_asset_check_summary_records",
+        wraps=storage.get_asset_check_summary_records,
+    ) as summary_records_mock, patch.object(
+        storage,
+        "get_asset_check_execution_history",
+        wraps=storage.get_asset_check_execution_history,
+    ) as execution_history_mock:
         # Upon evaluation, we shouldn't get a run request for any asset checks.
         assert isinstance(sensor(context), SkipReason)
-        # Cursor should be None, since we made it through all assets.
-        assert context.cursor is None
-
 
+    # The planned status is read off the batched summary record fetch, without any additional
+    # per-check queries.
+    assert summary_records_mock.call_count == 1
+    assert execution_history_mock.call_count == 0
+    # Cursor should be None, since we made it through all assets.
+    assert context.cursor is None
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        # Index of the check on "b" in the sorted check keys
+        "1",
+        # Cursors written by earlier versions of the sensor store the check key's user string
+        _ack("b").to_user_string(),
+    ],
+    ids=["index", "legacy_user_string"],
+)
 def test_sensor_cursor_recovery(
-    instance: DagsterInstance, pendulum_aware_report_dagster_event: None
+    instance: DagsterInstance,
+    frozen: pendulum.DateTime,
+    cursor: str,
 ) -> None:
     """Test the case where we have a cursor to evaluate from."""
 
@@ -192,62 +225,113 @@ def my_asset():
         assets=[my_asset], lower_bound_delta=datetime.timedelta(minutes=10)
     )
 
-    freeze_time = pendulum.now("UTC")
-    out_of_date_metadata = {
-        FRESH_UNTIL_METADATA_KEY: FloatMetadataValue(freeze_time.subtract(minutes=5).timestamp())
-    }
-    with pendulum_freeze_time(freeze_time):
-        instance.report_runless_asset_event(
-            AssetCheckEvaluation(
-                asset_key=AssetKey("a"),
-                check_name="freshness_check",
-                passed=True,
-                metadata=out_of_date_metadata,
-            )
-        )
-        instance.report_runless_asset_event(
-            AssetCheckEvaluation(
-                asset_key=AssetKey("b"),
-                check_name="freshness_check",
-                passed=True,
-                metadata=out_of_date_metadata,
-            )
-        )
-        instance.report_runless_asset_event(
-            AssetCheckEvaluation(
-                asset_key=AssetKey("c"),
-                check_name="freshness_check",
-                passed=True,
-                metadata=out_of_date_metadata,
-            )
-        )
-        instance.report_runless_asset_event(
+    out_of_date_metadata = _fresh_meta(frozen.timestamp(), _OUT_OF_DATE_TS_OFFSET)
+    # Batch-reported events bypass report_dagster_event, so they are stored with the wall clock
+    # timestamp rather than the frozen time. The sensor only compares fresh until metadata against
+    # the frozen clock, so the stored timestamp does not affect the result.
+    instance.report_runless_asset_events(
+        [
             AssetCheckEvaluation(
-                asset_key=AssetKey("d"),
+                asset_key=_ak(asset_key),
                 check_name="freshness_check",
                 passed=True,
                 metadata=out_of_date_metadata,
             )
-        )
+            for asset_key in ["a", "b", "c", "d"]
+        ]
+    )
+
+    sensor = build_sensor_for_freshness_checks(freshness_checks=freshness_checks)
+    defs = Definitions(asset_checks=freshness_checks, assets=[my_asset], sensors=[sensor])
+
+    # Since we're starting evaluation at the second asset, we should have started evaluation at the third asset.
+    context = build_sensor_context(
+        instance=instance,
+        definitions=defs,
+        cursor=cursor,
+    )
+
+    # Upon evaluation, we should get a run request for .
+    run_request = sensor(context)
+    assert isinstance(run_request, RunRequest)
+    assert run_request.asset_check_keys == [
+        _ack("c"),
+        _ack("d"),
+        _ack("a"),
+        _ack("b"),
+    ]
+    # Cursor should be None, since we made it through all remaining assets.
+    assert context.cursor is None
+
+
+@pytest.mark.parametrize(
+    "max_bind_params, expected_num_fetches",
+    [
+        ("500", 1),
+        ("4", 2),
+        ("3", 4),
+        ("2", 4),
+        ("0", 4),
+    ],
+)
+def test_sensor_chunked_summary_record_fetches(
+    instance: DagsterInstance,
+    pendulum_aware_report_dagster_event: None,
+    frozen: pendulum.DateTime,
+    monkeypatch: pytest.MonkeyPatch,
+    max_bind_params: str,
+    expected_num_fetches: int,
+) -> None:
+    """Test that the sensor fetches check summary records in chunks bounded by the bind parameter
+    budget, and that cursor ordering is preserved across chunk boundaries.
+    """
+    monkeypatch.setenv("ASSET_CHECK_SENSOR_MAX_BIND_PARAMS", max_bind_params)
 
-        sensor = build_sensor_for_freshness_checks(freshness_checks=freshness_checks)
-        defs = Definitions(asset_checks=freshness_checks, assets=[my_asset], sensors=[sensor])
+    @multi_asset(
+        outs={
+            "a": AssetOut(),
+            "b": AssetOut(),
+            "c": AssetOut(),
+            "d": AssetOut(),
+        },
+    )
+    def my_asset():
+        pass
 
-        # Since we're starting evaluation at the second asset, we should have started evaluation at the third asset.
-        context = build_sensor_context(
-            instance=instance,
-            definitions=defs,
-            cursor=AssetCheckKey(AssetKey("b"), "freshness_check").to_user_string(),
+    freshness_checks = build_last_update_freshness_checks(
+        assets=[my_asset], lower_bound_delta=datetime.timedelta(minutes=10)
+    )
+
+    # Only "c" is not yet overdue, so it should be skipped.
+    instance.report_runless_asset_event(
+        AssetCheckEvaluation(
+            asset_key=_ak("c"),
+            check_name="freshness_check",
+            passed=True,
+            metadata=_fresh_meta(frozen.timestamp(), _FRESH_TS_OFFSET),
         )
+    )
 
-        # Upon evaluation, we should get a run request for .
+    sensor = build_sensor_for_freshness_checks(freshness_checks=freshness_checks)
+    defs = Definitions(asset_checks=freshness_checks, assets=[my_asset], sensors=[sensor])
+    context = build_sensor_context(
+        instance=instance,
+        definitions=defs,
+        cursor="0",
+    )
+
+    with patch.object(
+        instance.event_log_storage,
+        "get_asset_check_summary_records",
+        wraps=instance.event_log_storage.get_asset_check_summary_records,
+    ) as fetch_mock:
         run_request = sensor(context)
-        assert isinstance(run_request, RunRequest)
-        assert run_request.asset_check_keys == [
-            AssetCheckKey(AssetKey("c"), "freshness_check"),
-            AssetCheckKey(AssetKey("d"), "freshness_check"),
-            AssetCheckKey(AssetKey("a"), "freshness_check"),
-            AssetCheckKey(AssetKey("b"), "freshness_check"),
-        ]
-        # Cursor should be None, since we made it through all remaining assets.
-        assert context.cursor is None
+
+    assert fetch_mock.call_count == expected_num_fetches
+    assert isinstance(run_request, RunRequest)
+    assert run_request.asset_check_keys == [
+        _ack("b"),
+        _ack("d"),
+        _ack("a"),
+    ]
+    assert context.cursor is None
@@ -5575,6 +5575,51 @@ def test_external_asset_event(
         assert mat.asset_materialization
         assert mat.asset_materialization.metadata["was"].value == "here"
 
+    def test_runless_asset_check_evaluation_batch(self, storage: EventLogStorage):
+        if self.can_wipe():
+            storage.wipe()
+
+        check_keys = [
+            AssetCheckKey(AssetKey(["my_asset"]), "my_check"),
+            AssetCheckKey(AssetKey(["my_asset"]), "my_check_2"),
+            AssetCheckKey(AssetKey(["my_other_asset"]), "my_check"),
+        ]
+        storage.store_event_batch(
+            [
+                EventLogEntry(
+                    error_info=None,
+                    user_message="",
+                    level="debug",
+                    run_id=RUNLESS_RUN_ID,
+                    timestamp=time.time(),
+                    dagster_event=DagsterEvent(
+                        DagsterEventType.ASSET_CHECK_EVALUATION.value,
+                        job_name=RUNLESS_JOB_NAME,
+                        event_specific_data=AssetCheckEvaluation(
+                            asset_key=check_key.asset_key,
+                            check_name=check_key.name,
+                            passed=i % 2 == 0,
+                            metadata={},
+                        ),
+                    ),
+                )
+                for i, check_key in enumerate(check_keys)
+            ]
+        )
+
+        latest_executions = storage.get_latest_asset_check_execution_by_key(check_keys)
+        assert len(latest_executions) == 3
+        assert [latest_executions[check_key].status for check_key in check_keys] == [
+            AssetCheckExecutionRecordStatus.SUCCEEDED,
+            AssetCheckExecutionRecordStatus.FAILED,
+            AssetCheckExecutionRecordStatus.SUCCEEDED,
+        ]
+        for check_key in check_keys:
+            event = latest_executions[check_key].event
+            assert event
+            assert event.asset_check_evaluation
+            assert event.asset_check_evaluation.asset_check_key == check_key
+
     def test_asset_check_summary_record(
         self,
         storage: EventLogStorage,
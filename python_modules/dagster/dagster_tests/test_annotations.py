@@ -2,6 +2,7 @@
 import sys
 import warnings
 from abc import abstractmethod
+from functools import lru_cache, reduce
 from typing import NamedTuple, get_type_hints
 
 import pytest
@@ -28,14 +29,23 @@
 
 from dagster_tests.general_tests.utils_tests.utils import assert_no_warnings
 
+# Warning patterns shared by multiple tests, compiled once at import.
+_CLASS_FOO_DEPRECATED_RE = re.compile(r"Class `[^`]+Foo` is deprecated and will be removed in 2.0")
+_FOO_BAR_DEPRECATED_RE = re.compile(r"`[^`]+Foo.bar` is deprecated and will be removed in 2.0")
+_FOO_BAR_BAZ_DEPRECATED_RE = re.compile(r"Parameter `baz` of [^`]+`[^`]+Foo.bar` is deprecated")
+_FOO_INIT_BAZ_DEPRECATED_RE = re.compile(
+    r"Parameter `baz` of [^`]+`[^`]+Foo.__init__` is deprecated"
+)
+_FOO_BAR_EXPERIMENTAL_RE = re.compile(r"`[^`]+Foo.bar` is experimental")
+_FOO_BAR_BAZ_EXPERIMENTAL_RE = re.compile(r"Parameter `baz` of [^`]+`[^`]+Foo.bar` is experimental")
+_FOO_INIT_BAZ_EXPERIMENTAL_RE = re.compile(
+    r"Parameter `baz` of [^`]+`[^`]+Foo.__init__` is experimental"
+)
 
-def compose_decorators(*decorators):
-    def _decorator(fn):
-        for decorator in reversed(decorators):
-            fn = decorator(fn)
-        return fn
 
-    return _decorator
+@lru_cache(maxsize=None)
+def compose_decorators(*decorators):
+    return lambda fn: reduce(lambda f, decorator: decorator(f), reversed(decorators), fn)
 
 
 # ########################
@@ -150,9 +160,7 @@ def bar(self):
 
     assert is_deprecated(Foo.__dict__["bar"])  # __dict__ access to get property
 
-    with pytest.warns(
-        DeprecationWarning, match=r"`[^`]+Foo.bar` is deprecated and will be removed in 2.0"
-    ) as warning:
+    with pytest.warns(DeprecationWarning, match=_FOO_BAR_DEPRECATED_RE) as warning:
         assert Foo().bar
     assert warning[0].filename.endswith("test_annotations.py")
 
@@ -176,9 +184,7 @@ def bar():
 
     assert is_deprecated(Foo.__dict__["bar"])  # __dict__ access to get descriptor
 
-    with pytest.warns(
-        DeprecationWarning, match=r"`[^`]+Foo.bar` is deprecated and will be removed in 2.0"
-    ) as warning:
+    with pytest.warns(DeprecationWarning, match=_FOO_BAR_DEPRECATED_RE) as warning:
         Foo.bar()
     assert warning[0].filename.endswith("test_annotations.py")
 
@@ -202,9 +208,7 @@ def bar(cls):
 
     assert is_deprecated(Foo.__dict__["bar"])  # __dict__ access to get descriptor
 
-    with pytest.warns(
-        DeprecationWarning, match=r"`[^`]+Foo.bar` is deprecated and will be removed in 2.0"
-    ) as warning:
+    with pytest.warns(DeprecationWarning, match=_FOO_BAR_DEPRECATED_RE) as warning:
         Foo.bar()
     assert warning[0].filename.endswith("test_annotations.py")
 
@@ -235,9 +239,7 @@ def bar(self): ...
 
     assert is_deprecated(Foo)
 
-    with pytest.warns(
-        DeprecationWarning, match=r"Class `[^`]+Foo` is deprecated and will be removed in 2.0"
-    ) as warning:
+    with pytest.warns(DeprecationWarning, match=_CLASS_FOO_DEPRECATED_RE) as warning:
         Foo()
     assert warning[0].filename.endswith("test_annotations.py")
 
@@ -247,9 +249,7 @@ def test_deprecated_namedtuple_class():
     class Foo(NamedTuple("_", [("bar", str)])):
         pass
 
-    with pytest.warns(
-        DeprecationWarning, match=r"Class `[^`]+Foo` is deprecated and will be removed in 2.0"
-    ) as warning:
+    with pytest.warns(DeprecationWarning, match=_CLASS_FOO_DEPRECATED_RE) as warning:
         Foo(bar="ok")
     assert warning[0].filename.endswith("test_annotations.py")
 
@@ -294,9 +294,7 @@ def bar(self, baz=None):
 
     assert is_deprecated_param(Foo.bar, "baz")
 
-    with pytest.warns(
-        DeprecationWarning, match=r"Parameter `baz` of [^`]+`[^`]+Foo.bar` is deprecated"
-    ) as warning:
+    with pytest.warns(DeprecationWarning, match=_FOO_BAR_BAZ_DEPRECATED_RE) as warning:
         Foo().bar(baz="ok")
     assert warning[0].filename.endswith("test_annotations.py")
 
@@ -320,9 +318,7 @@ def bar(baz=None):
 
     assert is_deprecated_param(Foo.__dict__["bar"], "baz")  # __dict__ to access descriptor
 
-    with pytest.warns(
-        DeprecationWarning, match=r"Parameter `baz` of [^`]+`[^`]+Foo.bar` is deprecated"
-    ) as warning:
+    with pytest.warns(DeprecationWarning, match=_FOO_BAR_BAZ_DEPRECATED_RE) as warning:
         Foo.bar(baz="ok")
     assert warning[0].filename.endswith("test_annotations.py")
 
@@ -346,9 +342,7 @@ def bar(cls, baz=None):
 
     assert is_deprecated_param(Foo.__dict__["bar"], "baz")  # __dict__ to access descriptor
 
-    with pytest.warns(
-        DeprecationWarning, match=r"Parameter `baz` of [^`]+`[^`]+Foo.bar` is deprecated"
-    ) as warning:
+    with pytest.warns(DeprecationWarning, match=_FOO_BAR_BAZ_DEPRECATED_RE) as warning:
         Foo.bar(baz="ok")
     assert warning[0].filename.endswith("test_annotations.py")
 
@@ -379,9 +373,7 @@ def __init__(self, baz=None): ...
 
     assert is_deprecated_param(Foo, "baz")
 
-    with pytest.warns(
-        DeprecationWarning, match=r"Parameter `baz` of [^`]+`[^`]+Foo.__init__` is deprecated"
-    ) as warning:
+    with pytest.warns(DeprecationWarning, match=_FOO_INIT_BAZ_DEPRECATED_RE) as warning:
         Foo(baz="ok")
     assert warning[0].filename.endswith("test_annotations.py")
 
@@ -393,9 +385,7 @@ def __new__(cls, baz=None): ...
 
     assert is_deprecated_param(Foo, "baz")
 
-    with pytest.warns(
-        DeprecationWarning, match=r"Parameter `baz` of [^`]+`[^`]+Foo.__init__` is deprecated"
-    ) as warning:
+    with pytest.warns(DeprecationWarning, match=_FOO_INIT_BAZ_DEPRECATED_RE) as warning:
         Foo(baz="ok")
     assert warning[0].filename.endswith("test_annotations.py")
 
@@ -422,7 +412,7 @@ def bar(self):
     assert is_experimental(Foo.bar)
     assert get_experimental_info(Foo.bar).additional_warn_text == "baz"
 
-    with pytest.warns(ExperimentalWarning, match=r"`[^`]+Foo.bar` is experimental") as warning:
+    with pytest.warns(ExperimentalWarning, match=_FOO_BAR_EXPERIMENTAL_RE) as warning:
         Foo().bar()
     assert warning[0].filename.endswith("test_annotations.py")
 
@@ -446,7 +436,7 @@ def bar(self):
 
     assert is_experimental(Foo.__dict__["bar"])  # __dict__ access to get descriptor
 
-    with pytest.warns(ExperimentalWarning, match=r"`[^`]+Foo.bar` is experimental") as warning:
+    with pytest.warns(ExperimentalWarning, match=_FOO_BAR_EXPERIMENTAL_RE) as warning:
         assert Foo().bar
     assert warning[0].filename.endswith("test_annotations.py")
 
@@ -470,7 +460,7 @@ def bar():
 
     assert is_experimental(Foo.__dict__["bar"])  # __dict__ access to get descriptor
 
-    with pytest.warns(ExperimentalWarning, match=r"`[^`]+Foo.bar` is experimental") as warning:
+    with pytest.warns(ExperimentalWarning, match=_FOO_BAR_EXPERIMENTAL_RE) as warning:
         Foo.bar()
     assert warning[0].filename.endswith("test_annotations.py")
 
@@ -494,7 +484,7 @@ def bar(cls):
 
     assert is_experimental(Foo.__dict__["bar"])  # __dict__ access to get descriptor
 
-    with pytest.warns(ExperimentalWarning, match=r"`[^`]+Foo.bar` is experimental") as warning:
+    with pytest.warns(ExperimentalWarning, match=_FOO_BAR_EXPERIMENTAL_RE) as warning:
         Foo.bar()
     assert warning[0].filename.endswith("test_annotations.py")
 
@@ -622,9 +612,7 @@ def bar(self, baz=None):
 
     assert is_experimental_param(Foo.bar, "baz")
 
-    with pytest.warns(
-        ExperimentalWarning, match=r"Parameter `baz` of [^`]+`[^`]+Foo.bar` is experimental"
-    ) as warning:
+    with pytest.warns(ExperimentalWarning, match=_FOO_BAR_BAZ_EXPERIMENTAL_RE) as warning:
         Foo().bar(baz="ok")
     assert warning[0].filename.endswith("test_annotations.py")
 
@@ -648,9 +636,7 @@ def bar(baz=None):
 
     assert is_experimental_param(Foo.__dict__["bar"], "baz")  # __dict__ to access descriptor
 
-    with pytest.warns(
-        ExperimentalWarning, match=r"Parameter `baz` of [^`]+`[^`]+Foo.bar` is experimental"
-    ) as warning:
+    with pytest.warns(ExperimentalWarning, match=_FOO_BAR_BAZ_EXPERIMENTAL_RE) as warning:
         Foo.bar(baz="ok")
     assert warning[0].filename.endswith("test_annotations.py")
 
@@ -674,9 +660,7 @@ def bar(cls, baz=None):
 
     assert is_experimental_param(Foo.__dict__["bar"], "baz")  # __dict__ to access descriptor
 
-    with pytest.warns(
-        ExperimentalWarning, match=r"Parameter `baz` of [^`]+`[^`]+Foo.bar` is experimental"
-    ) as warning:
+    with pytest.warns(ExperimentalWarning, match=_FOO_BAR_BAZ_EXPERIMENTAL_RE) as warning:
         Foo.bar(baz="ok")
     assert warning[0].filename.endswith("test_annotations.py")
 
@@ -707,9 +691,7 @@ def __init__(self, baz=None): ...
 
     assert is_experimental_param(Foo, "baz")
 
-    with pytest.warns(
-        ExperimentalWarning, match=r"Parameter `baz` of [^`]+`[^`]+Foo.__init__` is experimental"
-    ) as warning:
+    with pytest.warns(ExperimentalWarning, match=_FOO_INIT_BAZ_EXPERIMENTAL_RE) as warning:
         Foo(baz="ok")
     assert warning[0].filename.endswith("test_annotations.py")
 
@@ -721,9 +703,7 @@ def __new__(cls, baz=None): ...
 
     assert is_experimental_param(Foo, "baz")
 
-    with pytest.warns(
-        ExperimentalWarning, match=r"Parameter `baz` of [^`]+`[^`]+Foo.__init__` is experimental"
-    ) as warning:
+    with pytest.warns(ExperimentalWarning, match=_FOO_INIT_BAZ_EXPERIMENTAL_RE) as warning:
         Foo(baz="ok")
     assert warning[0].filename.endswith("test_annotations.py")
 
@@ -761,3 +741,26 @@ def foo():
 
     dep = next(warning for warning in all_warnings if warning.category == DeprecationWarning)
     assert re.search(r"`[^`]+foo` is deprecated", str(dep.message))
+
+
+def test_annotations_inherited_from_multiple_bases():
+    @public
+    class A:
+        pass
+
+    @deprecated(breaking_version="2.0")
+    class B:
+        pass
+
+    @experimental
+    class C:
+        pass
+
+    class D(A, B, C):
+        pass
+
+    assert is_public(D)
+    assert is_deprecated(D)
+    assert get_deprecated_info(D).breaking_version == "2.0"
+    assert is_experimental(D)
+    assert get_experimental_info(D)
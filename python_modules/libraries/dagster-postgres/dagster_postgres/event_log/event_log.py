@@ -208,10 +208,13 @@ def store_event(self, event: EventLogEntry) -> None:
     def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
         check.sequence_param(events, "event", of_type=EventLogEntry)
 
-        check.invariant(
-            all(event.get_dagster_event().event_type in BATCH_WRITABLE_EVENTS for event in events),
-            f"{BATCH_WRITABLE_EVENTS} are the only currently supported events for batch writes.",
-        )
+        # Batches of events that are not asset materializations or observations are handled by the
+        # generic SQL storage implementation
+        if not all(
+            event.get_dagster_event().event_type in BATCH_WRITABLE_EVENTS for event in events
+        ):
+            super().store_event_batch(events)
+            return
 
         insert_event_statement = self.prepare_insert_event_batch(events)
         with self._connect() as conn: